@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# File: completers.py
+#
+# Copyright 2026 Costas Tyfoxylos
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Completers for the interactive search of enpassreadercli.
+
+.. _Google Python Style Guide:
+   http://google.github.io/styleguide/pyguide.html
+
+"""
+
+from functools import lru_cache
+from itertools import islice
+from prompt_toolkit.completion import Completer, Completion
+from rapidfuzz import fuzz, process, utils
+
+__author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
+__docformat__ = '''google'''
+__date__ = '''15-10-2026'''
+__copyright__ = '''Copyright 2026, Costas Tyfoxylos'''
+__credits__ = ["Costas Tyfoxylos"]
+__license__ = '''MIT'''
+__maintainer__ = '''Costas Tyfoxylos'''
+__email__ = '''<costas.tyf@gmail.com>'''
+__status__ = '''Development'''  # "Prototype", "Development", "Production".
+
+# The maximum number of completions offered on each keypress, further typing narrows the results down.
+MAX_COMPLETIONS = 30
+# The minimum length of the typed text before any completions are calculated.
+MINIMUM_QUERY_LENGTH = 2
+# The number of recently typed texts whose completions are kept, so deleting and retyping does not recalculate them.
+COMPLETIONS_CACHE_SIZE = 128
+# The minimum weighted ratio, out of 100, for a title to be offered by the fuzzy search.
+FUZZY_SCORE_CUTOFF = 50
+
+
+class TitleTrie:
+    """Prefix tree over the lowercased entry titles for fast prefix lookups."""
+
+    def __init__(self, titles=()):
+        self._root = {}
+        for title in titles:
+            self.add(title)
+
+    def add(self, title):
+        """
+        Adds a title to the trie.
+
+        Every node holds the titles sharing its prefix so lookups do not need to walk the subtree.
+
+        Args:
+            title: The title to add
+
+        """
+        node = self._root
+        for character in title.lower():
+            node = node.setdefault(character, {None: []})
+            node[None].append(title)
+
+    def get_titles(self, prefix):
+        """
+        Retrieves the titles starting with the provided prefix, case insensitive.
+
+        Args:
+            prefix: The prefix to look up
+
+        Returns:
+            list: The matching titles in insertion order
+
+        """
+        node = self._root
+        for character in prefix.lower():
+            node = node.get(character)
+            if node is None:
+                return []
+        return node.get(None, [])
+
+
+class EnpassCompleter(Completer):
+    """Completer for enpass on keypress for the interactive search."""
+
+    def __init__(self, titles):
+        self._trie = TitleTrie(titles)
+        # Lowercased once so case insensitive matching on keypress does not lowercase every title.
+        self._lowered_titles = [(title.lower(), title) for title in titles]
+        self._get_cached_completions = lru_cache(maxsize=COMPLETIONS_CACHE_SIZE)(self._get_completions)
+
+    def _get_matches(self, text):
+        prefix_matches = self._trie.get_titles(text)
+        yield from prefix_matches
+        prefix_matches = set(prefix_matches)
+        # Every word typed has to be in the title, in any order.
+        words = text.split()
+        # Titles shorter than the longest word cannot contain it.
+        minimum_length = max((len(word) for word in words), default=0)
+        for lowered_title, title in self._lowered_titles:
+            if (len(lowered_title) >= minimum_length
+                    and all(word in lowered_title for word in words)
+                    and title not in prefix_matches):
+                yield title
+
+    def _get_completions(self, text):
+        # Whitespace is not counted since it splits words without matching anything itself.
+        if len(text.strip()) < MINIMUM_QUERY_LENGTH:
+            return ()
+        return tuple(Completion(title, start_position=-len(text))
+                     for title in islice(self._get_matches(text.lower()), MAX_COMPLETIONS))
+
+    def get_completions(self, document, complete_event):
+        """Yields the titles containing the typed words, the ones starting with the typed text first."""
+        yield from self._get_cached_completions(document.text)
+
+
+class FuzzyEnpassCompleter(Completer):
+    """Completer for enpass on keypress for the interactive fuzzy search."""
+
+    def __init__(self, titles):
+        # Processed once so scoring on keypress only processes the typed text.
+        self._processed_titles = {title: utils.default_process(title) for title in titles}
+        self._get_cached_completions = lru_cache(maxsize=COMPLETIONS_CACHE_SIZE)(self._get_completions)
+
+    def _get_completions(self, text):
+        if len(text.strip()) < MINIMUM_QUERY_LENGTH:
+            return ()
+        matches = process.extract(utils.default_process(text),
+                                  self._processed_titles,
+                                  scorer=fuzz.WRatio,
+                                  processor=None,
+                                  limit=MAX_COMPLETIONS,
+                                  score_cutoff=FUZZY_SCORE_CUTOFF)
+        return tuple(Completion(title, start_position=-len(text)) for _, _, title in matches)
+
+    def get_completions(self, document, complete_event):
+        """Yields the titles matching the typed text fuzzily, best match first."""
+        yield from self._get_cached_completions(document.text)
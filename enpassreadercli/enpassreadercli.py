@@ -34,14 +34,12 @@ Main code for enpassreadercli.
 import logging
 import logging.config
 import os
+import sys
 import json
 import argparse
-import coloredlogs
 import pyotp
 from enpassreaderlib import EnpassDB
 from enpassreaderlib.enpassreaderlibexceptions import EnpassDatabaseError
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import Completer, Completion, FuzzyCompleter
 
 __author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
 __docformat__ = '''google'''
@@ -58,6 +56,10 @@ LOGGER_BASENAME = '''enpassreadercli'''
 LOGGER = logging.getLogger(LOGGER_BASENAME)
 LOGGER.addHandler(logging.NullHandler())
 
+# Enpass databases are sqlcipher encrypted so they start with the salt instead of the plain sqlite header.
+SQLITE_HEADER = b'SQLite format 3\x00'
+SALT_LENGTH = 16
+
 
 class DefaultVariable(argparse.Action):
     """Creates an action that looks up a variable in the environment."""
@@ -66,8 +68,7 @@ class DefaultVariable(argparse.Action):
     # python-argparse-mutually-exclusive-required-group-with-a-required-option
     def __init__(self, variable, required=True, default=None, **kwargs):
         if not default and variable:
-            if variable in os.environ:
-                default = os.environ[variable]
+            default = os.environ.get(variable, default)
         if required and default:
             required = False
         super().__init__(default=default, required=required, **kwargs)
@@ -146,21 +147,42 @@ def get_arguments():
                        action='store')
     group.add_argument("-e", "--enumerate",
                        help="List all the passwords in the database.",
-                       action="store_true",
-                       dest='list')
+                       action="store_const",
+                       const='list',
+                       dest='mode')
     group.add_argument("-s", "--search",
                        help="Interactively search for an entry in the database and return that password.",
-                       action="store_true",
-                       dest='search')
+                       action="store_const",
+                       const='search',
+                       dest='mode')
     group.add_argument("-f", "--fuzzy-search",
                        help="Interactively fuzzy search for an entry in the database and return that password.",
-                       action="store_true",
-                       dest='fuzzy')
-    parser.set_defaults(totp=False)
+                       action="store_const",
+                       const='fuzzy',
+                       dest='mode')
+    parser.set_defaults(totp=False, mode='get')
     args = parser.parse_args()
     return args
 
 
+def load_json(json_file):
+    """
+    Loads json from a binary file object using orjson if it is available.
+
+    Args:
+        json_file: The file object opened in binary mode to load the json from
+
+    Returns:
+        The deserialized json
+
+    """
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return json.load(json_file)
+    return orjson.loads(json_file.read())
+
+
 def setup_logging(level, config_file=None):
     """
     Sets up the logging.
@@ -179,17 +201,142 @@ def setup_logging(level, config_file=None):
         # catching in case the file is not there and everything. Proper IO
         # handling is not shown here.
         try:
-            with open(config_file, encoding='utf-8') as conf_file:
-                configuration = json.loads(conf_file.read())
+            with open(config_file, 'rb') as conf_file:
+                configuration = load_json(conf_file)
                 # Configure the logger
                 logging.config.dictConfig(configuration)
         except ValueError:
             print(f'File "{config_file}" is not valid json, cannot continue.')
             raise SystemExit(1) from None
     else:
+        import coloredlogs  # pylint: disable=import-outside-toplevel
         coloredlogs.install(level=level.upper())
 
 
+def is_valid_database_file(path):
+    """
+    Checks cheaply that the path can hold an encrypted enpass database, before the expensive key derivation.
+
+    Args:
+        path: The path of the database file
+
+    Returns:
+        bool: True if the file is readable and starts with a salt, False otherwise
+
+    """
+    try:
+        with open(path, 'rb') as database_file:
+            header = database_file.read(SALT_LENGTH)
+    except OSError:
+        return False
+    return len(header) == SALT_LENGTH and header != SQLITE_HEADER
+
+
+def get_entry_value(entry, totp):
+    """
+    Gets the value of an entry.
+
+    Args:
+        entry: The entry to get the value of
+        totp: If set the current totp of the entry is returned instead of the password
+
+    Returns:
+        str: The password or the totp of the entry
+
+    """
+    return pyotp.TOTP(entry.totp_seed.replace(" ", "")).now() if totp else entry.password
+
+
+def get_entries_by_title(enpass):
+    """
+    Gets the entries of the database keyed by their lowercased title.
+
+    Titles are matched case insensitively and the first entry with a title is kept like get_entry of the database does.
+
+    Args:
+        enpass: The database to read the entries from
+
+    Returns:
+        dict: The entries keyed by their lowercased title
+
+    """
+    entries_by_title = {}
+    for entry in enpass.entries:
+        entries_by_title.setdefault(entry.title.lower(), entry)
+    return entries_by_title
+
+
+def print_entry(entry, entry_title, totp):
+    """
+    Prints the value of the entry found for the provided title.
+
+    Args:
+        entry: The entry found for the title, None if there was none
+        entry_title: The title the entry was looked up with
+        totp: If set the current totp of the entry is printed instead of the password
+
+    """
+    if not entry:
+        LOGGER.error(f'No password entry found with title of "{entry_title}".')
+        raise SystemExit(1) from None
+    print(get_entry_value(entry, totp))
+
+
+def enumerate_entries(args, enpass):
+    """
+    Prints the title and value of all the entries of the database.
+
+    Args:
+        args: The parsed cli arguments
+        enpass: The database to enumerate
+
+    """
+    lines = (f'{entry.title}: {get_entry_value(entry, args.totp)}' for entry in enpass.entries)
+    sys.stdout.write(''.join(f'{line}\n' for line in lines))
+
+
+def get_entry(args, enpass):
+    """
+    Prints the value of the entry requested on the cli.
+
+    Args:
+        args: The parsed cli arguments
+        enpass: The database to get the entry from
+
+    """
+    print_entry(enpass.get_entry(args.entry), args.entry, args.totp)
+
+
+def search_entry(args, enpass):
+    """
+    Interactively searches for an entry and prints its value.
+
+    Args:
+        args: The parsed cli arguments
+        enpass: The database to search in
+
+    """
+    # Only the interactive search needs these so they are not imported for the rest of the invocations.
+    # pylint: disable=import-outside-toplevel
+    from prompt_toolkit import prompt
+    from .completers import EnpassCompleter, FuzzyEnpassCompleter
+    entries_by_title = get_entries_by_title(enpass)
+    titles = [entry.title for entry in entries_by_title.values()]
+    completer = FuzzyEnpassCompleter(titles) if args.mode == 'fuzzy' else EnpassCompleter(titles)
+    try:
+        entry_title = prompt('Title :', completer=completer)
+    except KeyboardInterrupt:
+        raise SystemExit(0) from None
+    # The entries are already loaded for the completers so this saves querying the database again.
+    print_entry(entries_by_title.get(entry_title.lower()), entry_title, args.totp)
+
+
+MODE_HANDLERS = {'get': get_entry,
+                 'list': enumerate_entries,
+                 'search': search_entry,
+                 'fuzzy': search_entry}
+
+
 def main():
     """
     Main method.
@@ -199,39 +346,18 @@ def main():
     """
     args = get_arguments()
     setup_logging(args.log_level, args.logger_config)
+    if not is_valid_database_file(args.path):
+        LOGGER.error(f'The path provided ("{args.path}") is not a readable encrypted enpass database.')
+        raise SystemExit(1)
     try:
         enpass = EnpassDB(args.path, args.password, args.key_file, args.pbkdf2_rounds)
-
-        class EnpassCompleter(Completer):
-            """Completer for enpass on keypress for the interactive search."""
-
-            def get_completions(self, document, complete_event):
-                for match in [entry.title for entry in enpass.search_entries(document.text)]:
-                    yield Completion(match, start_position=-len(document.text))
     except EnpassDatabaseError:
         LOGGER.error(('Could not read or decrypt the database. '
                       'Please validate that the path provided is a valid enpass database, '
                       'that the provided password and optional key file are correct and that the pbkdf2 rounds'
                       f' provided ("{args.pbkdf2_rounds}") match the configuration of your database.'))
         raise SystemExit(1) from None
-    if args.list:
-        for entry in enpass.entries:
-            print(f'{entry.title}: '
-                  f'{pyotp.TOTP(entry.totp_seed.replace(" ", "")).now() if args.totp else entry.password}')
-        raise SystemExit(0)
-    if args.entry:
-        entry_title = args.entry
-    elif args.search or args.fuzzy:
-        try:
-            entry_title = prompt('Title :',
-                                 completer=EnpassCompleter() if args.search else FuzzyCompleter(EnpassCompleter()))
-        except KeyboardInterrupt:
-            raise SystemExit(0) from None
-    entry = enpass.get_entry(entry_title)
-    if not entry:
-        LOGGER.error(f'No password entry found with title of "{entry_title}".')
-        raise SystemExit(1) from None
-    print(pyotp.TOTP(entry.totp_seed.replace(" ", "")).now() if args.totp else entry.password)
+    MODE_HANDLERS[args.mode](args, enpass)
     raise SystemExit(0) from None
 
 
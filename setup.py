@@ -1,28 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pathlib import Path
 from setuptools import setup, find_packages
-try:
-    from pipenv.project import Project
-    from pipenv.utils import convert_deps_to_pip
 
-    pfile = Project().parsed_pipfile
-    requirements = convert_deps_to_pip(pfile['packages'], r=False)
-    test_requirements = convert_deps_to_pip(pfile['dev-packages'], r=False)
-except ImportError:
-    # get the requirements from the requirements.txt
+# get the requirements from the requirements.txt
+with open('requirements.txt', encoding='utf-8') as requirements_file:
     requirements = [line.strip()
-                    for line in open('requirements.txt').readlines()
+                    for line in requirements_file
                     if line.strip() and not line.startswith('#')]
-    # get the test requirements from the test_requirements.txt
+# get the test requirements from the dev-requirements.txt
+with open('dev-requirements.txt', encoding='utf-8') as test_requirements_file:
     test_requirements = [line.strip()
-                         for line in
-                         open('dev-requirements.txt').readlines()
+                         for line in test_requirements_file
                          if line.strip() and not line.startswith('#')]
 
-readme = open('README.rst').read()
-history = open('HISTORY.rst').read().replace('.. :changelog:', '')
-version = open('.VERSION').read()
+readme = Path('README.rst').read_text(encoding='utf-8')
+history = Path('HISTORY.rst').read_text(encoding='utf-8').replace('.. :changelog:', '')
+version = Path('.VERSION').read_text(encoding='utf-8')
 
 
 setup(
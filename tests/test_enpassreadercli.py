@@ -33,8 +33,23 @@ Tests for `enpassreadercli` module.
 
 """
 
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from unittest import TestCase
+
 from betamax.fixtures import unittest
 
+from prompt_toolkit.document import Document
+
+from enpassreadercli.completers import EnpassCompleter, FuzzyEnpassCompleter, TitleTrie
+from enpassreadercli.enpassreadercli import (SQLITE_HEADER,
+                                             get_entries_by_title,
+                                             is_valid_database_file,
+                                             print_entry)
+
 __author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
 __docformat__ = '''google'''
 __date__ = '''27-03-2021'''
@@ -63,3 +78,161 @@ class TestEnpassreadercli(unittest.BetamaxTestCase):
         This is where you should tear down what you've setup in setUp before. This method is called after every test.
         """
         pass
+
+
+class TestTitleTrie(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Builds a trie over titles sharing prefixes in different cases.
+        """
+        self.trie = TitleTrie(['GitHub', 'gitlab', 'Gmail', 'My Git'])
+
+    def test_prefix_lookup(self):
+        self.assertEqual(self.trie.get_titles('git'), ['GitHub', 'gitlab'])
+        self.assertEqual(self.trie.get_titles('gith'), ['GitHub'])
+        self.assertEqual(self.trie.get_titles('g'), ['GitHub', 'gitlab', 'Gmail'])
+
+    def test_prefix_lookup_is_case_insensitive(self):
+        self.assertEqual(self.trie.get_titles('GIT'), ['GitHub', 'gitlab'])
+        self.assertEqual(self.trie.get_titles('my g'), ['My Git'])
+
+    def test_missing_prefix(self):
+        self.assertEqual(self.trie.get_titles('bank'), [])
+        self.assertEqual(self.trie.get_titles('githubs'), [])
+
+
+class TestEnpassCompleter(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Builds a completer over a few titles.
+        """
+        self.completer = EnpassCompleter(['GitHub', 'My Git host', 'Gmail'])
+
+    def get_titles(self, text):
+        return [completion.text for completion in self.completer.get_completions(Document(text), None)]
+
+    def test_prefix_matches_come_first(self):
+        self.assertEqual(self.get_titles('git'), ['GitHub', 'My Git host'])
+
+    def test_words_match_in_any_order(self):
+        self.assertEqual(self.get_titles('host my'), ['My Git host'])
+
+    def test_whitespace_is_not_completed(self):
+        self.assertEqual(self.get_titles('  '), [])
+        self.assertEqual(self.get_titles(' g '), [])
+
+    def test_retyped_text_reuses_the_cached_completions(self):
+        completions = list(self.completer.get_completions(Document('git'), None))
+        self.assertTrue(completions)
+        list(self.completer.get_completions(Document('gi'), None))
+        cached_completions = list(self.completer.get_completions(Document('git'), None))
+        self.assertEqual(len(cached_completions), len(completions))
+        for cached, completion in zip(cached_completions, completions):
+            self.assertIs(cached, completion)
+
+
+class TestFuzzyEnpassCompleter(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Builds a fuzzy completer over a few titles.
+        """
+        self.completer = FuzzyEnpassCompleter(['GitHub', 'Gmail', 'Bank account'])
+
+    def get_titles(self, text):
+        return [completion.text for completion in self.completer.get_completions(Document(text), None)]
+
+    def test_abbreviations_and_reordering_match(self):
+        self.assertIn('GitHub', self.get_titles('gthb'))
+        self.assertIn('GitHub', self.get_titles('hubgit'))
+        self.assertEqual(self.get_titles('bnak')[0], 'Bank account')
+
+    def test_short_text_is_not_completed(self):
+        self.assertEqual(self.get_titles('g'), [])
+        self.assertEqual(self.get_titles(' g'), [])
+
+    def test_retyped_text_reuses_the_cached_completions(self):
+        completions = list(self.completer.get_completions(Document('gith'), None))
+        self.assertTrue(completions)
+        list(self.completer.get_completions(Document('git'), None))
+        cached_completions = list(self.completer.get_completions(Document('gith'), None))
+        self.assertEqual(len(cached_completions), len(completions))
+        for cached, completion in zip(cached_completions, completions):
+            self.assertIs(cached, completion)
+
+
+class TestIsValidDatabaseFile(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Creates a temporary directory to write the database files in.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Test tear down
+
+        Removes the temporary directory and the database files in it.
+        """
+        self.directory.cleanup()
+
+    def write_database(self, contents):
+        path = os.path.join(self.directory.name, 'vault.enpassdb')
+        with open(path, 'wb') as database_file:
+            database_file.write(contents)
+        return path
+
+    def test_missing_file(self):
+        self.assertFalse(is_valid_database_file(os.path.join(self.directory.name, 'missing.enpassdb')))
+
+    def test_short_file(self):
+        self.assertFalse(is_valid_database_file(self.write_database(os.urandom(8))))
+
+    def test_plain_sqlite_file(self):
+        self.assertFalse(is_valid_database_file(self.write_database(SQLITE_HEADER + os.urandom(4080))))
+
+    def test_encrypted_file(self):
+        self.assertTrue(is_valid_database_file(self.write_database(os.urandom(4096))))
+
+
+class TestEntriesByTitle(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        Builds the entries of a stub database with titles differing only in case.
+        """
+        enpass = SimpleNamespace(entries=[SimpleNamespace(title='GitHub', password='first'),
+                                          SimpleNamespace(title='github', password='second'),
+                                          SimpleNamespace(title='Gmail', password='third')])
+        self.entries_by_title = get_entries_by_title(enpass)
+
+    def print_entry(self, entry_title):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_entry(self.entries_by_title.get(entry_title.lower()), entry_title, False)
+        return output.getvalue()
+
+    def test_mixed_case_lookup(self):
+        self.assertEqual(self.print_entry('gMAIL'), 'third\n')
+
+    def test_first_entry_wins_for_titles_differing_in_case(self):
+        self.assertEqual(self.print_entry('github'), 'first\n')
+        self.assertEqual([entry.title for entry in self.entries_by_title.values()], ['GitHub', 'Gmail'])
+
+    def test_missing_title(self):
+        with self.assertRaises(SystemExit) as context:
+            self.print_entry('Bank')
+        self.assertEqual(context.exception.code, 1)